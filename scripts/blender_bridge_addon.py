@@ -8,11 +8,20 @@ bl_info = {
     "category": "Import-Export",
 }
 
+import base64
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import http.client
 import json
 import os
+import queue
+import shutil
 import ssl
 import tempfile
-import urllib.error
+import threading
+import time
 import urllib.parse
 import urllib.request
 
@@ -20,6 +29,82 @@ import bpy
 from bpy.props import BoolProperty, IntProperty, StringProperty
 from bpy.types import AddonPreferences, Operator, Panel
 
+_USER_AGENT = "Store3D-Blender-Bridge/%d.%d.%d" % bl_info["version"]
+_POOL_MAXSIZE = 8
+_MAX_REDIRECTS = 5
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+_SHM_DIR = "/dev/shm"
+_SHM_MAX_DOWNLOAD_BYTES = 128 << 20
+_TEMP_PREFIX = "store3d_bridge_"
+_IMPORT_ALL_WORKERS = 4
+_REDIRECT_CODES = frozenset((301, 302, 303, 307, 308))
+_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS"))
+_MODEL_FORMATS = frozenset(("glb", "gltf", "obj", "stl"))
+_MODEL_EXTENSIONS = frozenset((".glb", ".gltf", ".obj", ".stl"))
+_HTTP_SCHEMES = ("http://", "https://")
+_HTTP_CACHE_TTL = 5.0
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+# Job ids are a single path segment, so "/" must be escaped as well.
+_quote_path_segment = functools.partial(urllib.parse.quote, safe="")
+
+# Raw Server URL preference -> validated base URL; cleared when the preference changes.
+_BASE_URL_CACHE = {}
+
+# (scheme, netloc) -> (proxy host, proxy port, proxy headers), or None to connect directly.
+# Read from the environment/system proxy settings on first use, like urllib.request.urlopen.
+_PROXY_CACHE = {}
+
+# Idle keep-alive connections keyed by (scheme, netloc).
+_POOL = {}
+_POOL_LOCK = threading.Lock()
+
+# Recent GET responses keyed by (url, token): (expires_at, etag, payload).
+_HTTP_CACHE = {}
+_HTTP_CACHE_LOCK = threading.Lock()
+# Bumped on every invalidation so a GET that was in flight at the time is not stored.
+_HTTP_CACHE_GENERATION = 0
+
+# Built on first HTTPS connection and shared by every connection after that.
+_SSL_CTX_DEFAULT = None
+_SSL_CTX_INSECURE = None
+
+# Job id -> (thread, state) for the next queued model, downloaded ahead of the next import.
+_PREFETCHED = {}
+_PREFETCH_LOCK = threading.Lock()
+
+# Guards the done/abandoned hand-off of background job states (see _run_job) and of
+# Import all's download results (see _fetch_all_queued).
+_JOB_LOCK = threading.Lock()
+
+# Cache paths handed out by _fetch_model and not yet released -> pin count.
+# The LRU trim never deletes a pinned path.
+_CACHE_IN_USE = {}
+_CACHE_LOCK = threading.Lock()
+
+# File extension -> import operator, resolved once in register().
+_IMPORTERS = {}
+
+# Tasks (an operator's ``_task``) with a background operator currently running; operators
+# sharing a task exclude each other.
+_ACTIVE_OPERATORS = set()
+# Import latest and Import all both take jobs[0]; only one of them may run at a time.
+_IMPORT_TASK = "import"
+
+# Plain copy of the addon preferences that worker threads can read without touching bpy.
+_Settings = collections.namedtuple(
+    "_Settings",
+    (
+        "server_url",
+        "api_token",
+        "timeout_seconds",
+        "allow_insecure_tls",
+        "import_collection",
+        "cache_dir",
+        "cache_size_mb",
+    ),
+)
+
 
 def _get_prefs(context):
     addon = context.preferences.addons.get(__name__)
@@ -28,9 +113,24 @@ def _get_prefs(context):
     return addon.preferences
 
 
-def _json_from_text(text):
+def _snapshot_settings(context):
+    prefs = _get_prefs(context)
+    if not prefs:
+        raise RuntimeError("Bridge preferences are not available.")
+    return _Settings(
+        server_url=prefs.server_url,
+        api_token=prefs.api_token,
+        timeout_seconds=prefs.timeout_seconds,
+        allow_insecure_tls=prefs.allow_insecure_tls,
+        import_collection=prefs.import_collection,
+        cache_dir=bpy.utils.user_resource("DATAFILES", path="store3d_bridge_cache"),
+        cache_size_mb=prefs.cache_size_mb,
+    )
+
+
+def _json_from_bytes(data):
     try:
-        return json.loads(text)
+        return json.loads(data)
     except Exception:
         return {}
 
@@ -43,23 +143,246 @@ def _extract_error_message(payload, default):
     return default
 
 
-def _resolve_base_url(context):
-    prefs = _get_prefs(context)
-    if not prefs:
-        raise RuntimeError("Bridge preferences are not available.")
+def _resolve_base_url(settings):
+    raw_url = settings.server_url or ""
+    base_url = _BASE_URL_CACHE.get(raw_url)
+    if base_url is not None:
+        return base_url
 
-    base_url = (prefs.server_url or "").strip().rstrip("/")
+    base_url = raw_url.strip().rstrip("/")
     if not base_url:
         raise RuntimeError("Set Server URL in addon settings.")
-    if not (base_url.startswith("http://") or base_url.startswith("https://")):
+    if not base_url.startswith(_HTTP_SCHEMES):
         raise RuntimeError("Server URL must start with http:// or https://")
+    _BASE_URL_CACHE[raw_url] = base_url
     return base_url
 
 
-def _http_json(context, path, method="GET", body=None, use_auth=True):
-    prefs = _get_prefs(context)
-    base_url = _resolve_base_url(context)
-    token = (prefs.api_token or "").strip()
+def _ssl_context(settings):
+    global _SSL_CTX_DEFAULT, _SSL_CTX_INSECURE
+    if settings.allow_insecure_tls:
+        if _SSL_CTX_INSECURE is None:
+            _SSL_CTX_INSECURE = ssl._create_unverified_context()
+        return _SSL_CTX_INSECURE
+    if _SSL_CTX_DEFAULT is None:
+        _SSL_CTX_DEFAULT = ssl.create_default_context()
+    return _SSL_CTX_DEFAULT
+
+
+def _reset_ssl_contexts():
+    global _SSL_CTX_DEFAULT, _SSL_CTX_INSECURE
+    _SSL_CTX_DEFAULT = None
+    _SSL_CTX_INSECURE = None
+
+
+def _proxy_for(key):
+    """Return ``(host, port, headers)`` of the proxy to use for an origin, or None."""
+    if key in _PROXY_CACHE:
+        return _PROXY_CACHE[key]
+
+    scheme, netloc = key
+    proxy = None
+    proxy_url = urllib.request.getproxies().get(scheme)
+    if proxy_url and not urllib.request.proxy_bypass(netloc):
+        if "://" not in proxy_url:
+            proxy_url = f"http://{proxy_url}"
+        parsed = urllib.parse.urlsplit(proxy_url)
+        headers = {}
+        if parsed.username is not None:
+            user = urllib.parse.unquote(parsed.username)
+            password = urllib.parse.unquote(parsed.password or "")
+            token = base64.b64encode(f"{user}:{password}".encode("utf-8")).decode("ascii")
+            headers["Proxy-Authorization"] = f"Basic {token}"
+        proxy = (parsed.hostname, parsed.port or 80, headers)
+    _PROXY_CACHE[key] = proxy
+    return proxy
+
+
+def _new_connection(settings, key):
+    scheme, netloc = key
+    timeout = max(3, int(settings.timeout_seconds))
+    proxy = _proxy_for(key)
+    if proxy is not None:
+        proxy_host, proxy_port, proxy_headers = proxy
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(
+                proxy_host, proxy_port, timeout=timeout, context=_ssl_context(settings)
+            )
+            conn.set_tunnel(netloc, headers=proxy_headers)
+            return conn
+        return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+    if scheme == "https":
+        return http.client.HTTPSConnection(netloc, timeout=timeout, context=_ssl_context(settings))
+    return http.client.HTTPConnection(netloc, timeout=timeout)
+
+
+def _acquire_connection(settings, key):
+    with _POOL_LOCK:
+        idle = _POOL.get(key)
+        conn = idle.pop() if idle else None
+    if conn is None:
+        return _new_connection(settings, key), False
+
+    timeout = max(3, int(settings.timeout_seconds))
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _release_connection(key, conn, resp):
+    """Return a connection to the pool once its response body has been fully read."""
+    if resp.will_close:
+        conn.close()
+        return
+    with _POOL_LOCK:
+        idle = _POOL.setdefault(key, [])
+        if len(idle) < _POOL_MAXSIZE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _close_connections():
+    with _POOL_LOCK:
+        connections = [conn for idle in _POOL.values() for conn in idle]
+        _POOL.clear()
+    for conn in connections:
+        conn.close()
+
+
+def _on_connection_settings_update(_self, _context):
+    _BASE_URL_CACHE.clear()
+    _PROXY_CACHE.clear()
+    _close_connections()
+    _invalidate_http_cache()
+    _reset_ssl_contexts()
+
+
+def _open_response(settings, key, method, target, headers, data):
+    conn, reused = _acquire_connection(settings, key)
+    sent = False
+    try:
+        conn.request(method, target, body=data, headers=headers)
+        sent = True
+        return conn, conn.getresponse()
+    except _STALE_CONNECTION_ERRORS:
+        conn.close()
+        # Once the request is out the server may already have applied it (an ack, say),
+        # so only idempotent methods are repeated after that point.
+        if not reused or (sent and method not in _IDEMPOTENT_METHODS):
+            raise
+    except BaseException:
+        conn.close()
+        raise
+
+    # The server dropped an idle keep-alive connection; retry once on a fresh one.
+    conn = _new_connection(settings, key)
+    try:
+        conn.request(method, target, body=data, headers=headers)
+        return conn, conn.getresponse()
+    except BaseException:
+        conn.close()
+        raise
+
+
+def _send_request(settings, method, url, headers=None, data=None):
+    """Send a request over a pooled keep-alive connection, following GET redirects.
+
+    Returns ``(key, conn, resp)``. The caller must consume the response body and then
+    hand the connection back with ``_release_connection`` (or close it on failure).
+    """
+    headers = dict(headers or {})
+    headers.setdefault("User-Agent", _USER_AGENT)
+    # HTTP/1.1 keeps connections open by default; say so for HTTP/1.0 forward proxies too.
+    headers.setdefault("Connection", "keep-alive")
+
+    for _ in range(_MAX_REDIRECTS + 1):
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            raise RuntimeError(f"Unsupported URL: {url}")
+        key = (parsed.scheme, parsed.netloc)
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+        request_headers = headers
+        proxy = _proxy_for(key) if parsed.scheme == "http" else None
+        if proxy is not None:
+            # Plain HTTP goes to the proxy as an absolute URI; HTTPS is tunnelled by _new_connection.
+            target = f"http://{parsed.netloc}{target}"
+            request_headers = {**headers, **proxy[2]}
+
+        try:
+            conn, resp = _open_response(settings, key, method, target, request_headers, data)
+        except (OSError, http.client.HTTPException) as err:
+            raise RuntimeError(f"Network error: {err}") from err
+
+        location = resp.getheader("Location")
+        if method != "GET" or resp.status not in _REDIRECT_CODES or not location:
+            return key, conn, resp
+        _read_body(conn, resp)
+        _release_connection(key, conn, resp)
+        url = urllib.parse.urljoin(url, location)
+        if urllib.parse.urlsplit(url).netloc != parsed.netloc:
+            headers.pop("Authorization", None)
+
+    raise RuntimeError("Too many redirects.")
+
+
+def _cache_lifetime(resp):
+    """Seconds a response may be reused without asking the server, or None to not store it."""
+    cache_control = (resp.getheader("Cache-Control") or "").lower()
+    lifetime = _HTTP_CACHE_TTL
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "no-store":
+            return None
+        if name == "no-cache":
+            # Still stored so the ETag can be revalidated, but never reused without a request.
+            lifetime = 0
+        elif name == "max-age" and lifetime:
+            try:
+                lifetime = max(0, int(value))
+            except ValueError:
+                pass
+    return lifetime
+
+
+def _cache_response(cache_key, generation, resp, etag, payload):
+    lifetime = _cache_lifetime(resp)
+    with _HTTP_CACHE_LOCK:
+        if generation != _HTTP_CACHE_GENERATION:
+            # The cache was invalidated while this request was in flight; the payload may be stale.
+            return
+        if lifetime is None:
+            _HTTP_CACHE.pop(cache_key, None)
+        else:
+            _HTTP_CACHE[cache_key] = (time.monotonic() + lifetime, etag, payload)
+
+
+def _invalidate_http_cache():
+    global _HTTP_CACHE_GENERATION
+    with _HTTP_CACHE_LOCK:
+        _HTTP_CACHE_GENERATION += 1
+        _HTTP_CACHE.clear()
+
+
+def _read_body(conn, resp):
+    try:
+        return resp.read()
+    except (OSError, http.client.HTTPException) as err:
+        conn.close()
+        raise RuntimeError(f"Network error: {err}") from err
+
+
+def _http_json(settings, path, method="GET", body=None, use_auth=True, use_cache=True):
+    """Send a JSON API request and return the decoded object.
+
+    GET responses are cached briefly; ``use_cache=False`` always asks the server (the
+    fresh response still refreshes the cache).
+    """
+    base_url = _resolve_base_url(settings)
+    token = (settings.api_token or "").strip()
     if use_auth and not token:
         raise RuntimeError("Set API token in addon settings.")
 
@@ -70,83 +393,372 @@ def _http_json(context, path, method="GET", body=None, use_auth=True):
     if use_auth:
         headers["Authorization"] = f"Bearer {token}"
 
+    cache_key = None
+    cached = None
+    generation = None
+    if method == "GET":
+        cache_key = (url, token if use_auth else "")
+        with _HTTP_CACHE_LOCK:
+            cached = _HTTP_CACHE.get(cache_key) if use_cache else None
+            generation = _HTTP_CACHE_GENERATION
+        if cached:
+            expires_at, etag, payload = cached
+            if expires_at > time.monotonic():
+                return payload
+            if etag:
+                headers["If-None-Match"] = etag
+
     data = None
     if body is not None:
         data = json.dumps(body).encode("utf-8")
         headers["Content-Type"] = "application/json"
 
-    request = urllib.request.Request(url=url, data=data, headers=headers, method=method)
-    context_ssl = None
-    if prefs.allow_insecure_tls:
-        context_ssl = ssl._create_unverified_context()
+    key, conn, resp = _send_request(settings, method, url, headers=headers, data=data)
+    raw = _read_body(conn, resp)
+    _release_connection(key, conn, resp)
+
+    if resp.status == 304 and cached:
+        _, etag, payload = cached
+        _cache_response(cache_key, generation, resp, resp.getheader("ETag") or etag, payload)
+        return payload
 
+    payload = _json_from_bytes(raw)
+    if not 200 <= resp.status < 300:
+        text = raw.decode("utf-8", errors="replace").strip()
+        msg = _extract_error_message(payload, text or f"HTTP {resp.status}")
+        raise RuntimeError(f"HTTP {resp.status}: {msg}")
+    if isinstance(payload, dict):
+        if cache_key:
+            _cache_response(cache_key, generation, resp, resp.getheader("ETag"), payload)
+        return payload
+    raise RuntimeError("Server returned non-JSON response.")
+
+
+def _download_dir(content_length):
+    """Return a RAM-backed temp dir when the download comfortably fits, otherwise None.
+
+    Only used when the download cache is disabled: cached downloads are written straight
+    into the cache directory so they can be renamed into place instead of copied off tmpfs.
+    """
+    if not content_length or not os.path.isdir(_SHM_DIR):
+        return None
     try:
-        with urllib.request.urlopen(request, timeout=max(3, int(prefs.timeout_seconds)), context=context_ssl) as resp:
-            text = resp.read().decode("utf-8", errors="replace")
-            payload = _json_from_text(text)
-            if isinstance(payload, dict):
-                return payload
-            raise RuntimeError("Server returned non-JSON response.")
-    except urllib.error.HTTPError as err:
-        text = err.read().decode("utf-8", errors="replace") if err.fp else ""
-        payload = _json_from_text(text)
-        msg = _extract_error_message(payload, text.strip() or f"HTTP {err.code}")
-        raise RuntimeError(f"HTTP {err.code}: {msg}") from err
-    except urllib.error.URLError as err:
-        raise RuntimeError(f"Network error: {err.reason}") from err
+        size = int(content_length)
+        stat = os.statvfs(_SHM_DIR)
+    except (ValueError, OSError):
+        return None
+    if size > _SHM_MAX_DOWNLOAD_BYTES or size * 2 > stat.f_bavail * stat.f_frsize:
+        return None
+    return _SHM_DIR
 
 
-def _download_file(context, url, suffix):
-    prefs = _get_prefs(context)
-    token = (prefs.api_token or "").strip() if prefs else ""
+def _download_file(settings, url, suffix, temp_dir=None):
+    token = (settings.api_token or "").strip()
 
     headers = {}
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
-    request = urllib.request.Request(url=url, headers=headers, method="GET")
-    context_ssl = None
-    if prefs and prefs.allow_insecure_tls:
-        context_ssl = ssl._create_unverified_context()
-
-    with urllib.request.urlopen(request, timeout=max(3, int(prefs.timeout_seconds)), context=context_ssl) as resp:
-        payload = resp.read()
+    key, conn, resp = _send_request(settings, "GET", url, headers=headers)
+    if not 200 <= resp.status < 300:
+        _read_body(conn, resp)
+        _release_connection(key, conn, resp)
+        raise RuntimeError(f"Download failed: HTTP {resp.status}")
 
-    fd, temp_path = tempfile.mkstemp(prefix="store3d_bridge_", suffix=suffix)
-    os.close(fd)
-    with open(temp_path, "wb") as f:
-        f.write(payload)
+    # Stream straight to disk so large models are never held in memory as one bytes object.
+    if temp_dir is None:
+        temp_dir = _download_dir(resp.getheader("Content-Length"))
+    fd, temp_path = tempfile.mkstemp(prefix=_TEMP_PREFIX, suffix=suffix, dir=temp_dir)
+    try:
+        with os.fdopen(fd, "wb", buffering=_DOWNLOAD_CHUNK_SIZE) as f:
+            shutil.copyfileobj(resp, f, length=_DOWNLOAD_CHUNK_SIZE)
+        # read(amt) returns b"" on early EOF instead of raising, so check what is left.
+        if resp.length:
+            raise http.client.IncompleteRead(b"", resp.length)
+    except (OSError, http.client.HTTPException) as err:
+        conn.close()
+        _remove_file(temp_path)
+        raise RuntimeError(f"Download failed: {err}") from err
+    _release_connection(key, conn, resp)
     return temp_path
 
 
+def _remove_file(path):
+    if path and os.path.isfile(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _pin_cache_path(path):
+    with _CACHE_LOCK:
+        _CACHE_IN_USE[path] = _CACHE_IN_USE.get(path, 0) + 1
+
+
+def _unpin_cache_path(path):
+    with _CACHE_LOCK:
+        count = _CACHE_IN_USE.get(path, 0) - 1
+        if count > 0:
+            _CACHE_IN_USE[path] = count
+        else:
+            _CACHE_IN_USE.pop(path, None)
+
+
+def _trim_download_cache(cache_dir, max_bytes):
+    """Delete the least recently used unpinned entries until the cache fits in ``max_bytes``."""
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            # Skip downloads that are still being written.
+            if entry.name.startswith(_TEMP_PREFIX) or not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # A concurrent trim removed it after it was listed.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        # Check and delete under the lock so a concurrent cache hit cannot pin it in between.
+        with _CACHE_LOCK:
+            if path in _CACHE_IN_USE:
+                continue
+            _remove_file(path)
+        total -= size
+
+
+def _fetch_model(settings, asset_id, url, suffix):
+    """Download a job's model, going through the on-disk cache when it is enabled.
+
+    Returns ``(path, cached)``. Cached paths are pinned against the LRU trim; other paths
+    are temp files the caller owns. Either way, hand the result to ``_release_model``
+    once the import is done.
+    """
+    if not settings.cache_dir or settings.cache_size_mb <= 0:
+        return _download_file(settings, url, suffix), False
+
+    cache_key = hashlib.sha1(f"{asset_id}:{url}".encode("utf-8")).hexdigest()
+    cache_path = os.path.join(settings.cache_dir, cache_key + suffix)
+    _pin_cache_path(cache_path)
+    try:
+        if os.path.isfile(cache_path):
+            # Bump the mtime so the LRU trim treats this entry as recently used.
+            os.utime(cache_path)
+            return cache_path, True
+
+        os.makedirs(settings.cache_dir, exist_ok=True)
+        # _download_file raises (and deletes its temp file) on short or failed transfers,
+        # so only complete downloads ever reach the cache path. Staging in the cache dir
+        # skips tmpfs, trading a RAM-backed write for an atomic rename and no second copy.
+        temp_path = _download_file(settings, url, suffix, temp_dir=settings.cache_dir)
+        try:
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # Windows refuses to replace a file another import has open; use that copy instead.
+            _remove_file(temp_path)
+            if not os.path.isfile(cache_path):
+                raise
+    except BaseException:
+        _unpin_cache_path(cache_path)
+        raise
+    try:
+        _trim_download_cache(settings.cache_dir, settings.cache_size_mb << 20)
+    except OSError:
+        # The model is already in place; an over-budget cache is trimmed on the next miss.
+        pass
+    return cache_path, True
+
+
+def _release_model(model):
+    """Unpin a cached model or delete a temp one, as returned by ``_fetch_model``."""
+    if not model:
+        return
+    path, cached = model
+    if cached:
+        _unpin_cache_path(path)
+    else:
+        _remove_file(path)
+
+
+def _prefetch_job(settings, job):
+    """Start downloading ``job``'s model in the background so the next import can skip it."""
+    job_id = str(job.get("jobId", "")).strip()
+    asset_id = str(job.get("assetId", "")).strip()
+    download_url = str(job.get("downloadUrl", "")).strip()
+    if not job_id or not download_url:
+        return
+
+    # Only the most recent prefetch is kept around.
+    with _PREFETCH_LOCK:
+        if job_id in _PREFETCHED:
+            return
+    _discard_prefetched()
+
+    suffix = _infer_suffix(job)
+    state = {"done": False, "result": None, "error": None, "release": _release_model}
+    thread = threading.Thread(
+        target=_run_job,
+        args=(state, lambda: _fetch_model(settings, asset_id, download_url, suffix)),
+        daemon=True,
+    )
+    with _PREFETCH_LOCK:
+        _PREFETCHED[job_id] = (thread, state)
+        thread.start()
+
+
+def _take_prefetched(job_id):
+    """Return the prefetched ``(path, cached)`` for ``job_id``, waiting if still downloading.
+
+    Returns None when nothing usable was prefetched.
+    """
+    with _PREFETCH_LOCK:
+        entry = _PREFETCHED.pop(job_id, None)
+    if entry is None:
+        return None
+    thread, state = entry
+    thread.join()
+    return state["result"]
+
+
+def _discard_prefetched(job_id=None):
+    with _PREFETCH_LOCK:
+        if job_id is None:
+            entries = list(_PREFETCHED.values())
+            _PREFETCHED.clear()
+        else:
+            entry = _PREFETCHED.pop(job_id, None)
+            entries = [entry] if entry else []
+    # Downloads still in flight release their own model once they see the flag.
+    for _, state in entries:
+        _abandon_job(state)
+
+
 def _infer_suffix(job):
     fmt = str(job.get("format", "")).strip().lower()
-    if fmt in {"glb", "gltf", "obj", "stl"}:
+    if fmt in _MODEL_FORMATS:
         return f".{fmt}"
     download_url = str(job.get("downloadUrl", "")).strip()
     parsed = urllib.parse.urlparse(download_url)
     path = parsed.path or ""
     _, ext = os.path.splitext(path)
     ext = ext.lower()
-    if ext in {".glb", ".gltf", ".obj", ".stl"}:
+    if ext in _MODEL_EXTENSIONS:
         return ext
     return ".glb"
 
 
-def _ack_job(context, job_id, status, message=""):
+def _ack_job(settings, job_id, status, message=""):
     body = {"status": status}
     if message:
         body["message"] = message
-    path = f"/api/dcc/blender/jobs/{urllib.parse.quote(job_id)}/ack"
-    _http_json(context, path=path, method="POST", body=body)
+    path = f"/api/dcc/blender/jobs/{_quote_path_segment(job_id)}/ack"
+    try:
+        _http_json(settings, path=path, method="POST", body=body)
+        if status != "picked":
+            _discard_prefetched(job_id)
+    finally:
+        # Any job transition changes the queued list, so drop cached job listings.
+        _invalidate_http_cache()
+
+
+def _pick_and_download(settings, job_id, asset_id, download_url, suffix):
+    """Send the 'picked' ack on a second pooled connection while the model downloads.
+
+    A model already prefetched for ``job_id`` is used instead of downloading it again.
+    Returns ``(path, cached)`` as ``_fetch_model`` does.
+    """
+    ack_state = {"done": False, "result": None, "error": None}
+    ack_thread = threading.Thread(
+        target=_run_job,
+        args=(ack_state, lambda: _ack_job(settings, job_id, "picked", "Picked by Blender addon.")),
+        daemon=True,
+    )
+    ack_thread.start()
+    try:
+        model = _take_prefetched(job_id) or _fetch_model(settings, asset_id, download_url, suffix)
+    finally:
+        ack_thread.join()
+    if ack_state["error"] is not None:
+        _release_model(model)
+        raise ack_state["error"]
+    return model
+
+
+def _fetch_all_queued(settings, executor, results, cancelled):
+    """List queued jobs and fetch all their models on ``executor``.
+
+    Puts ``(job, model, error)`` on ``results`` as each download completes (``job`` is
+    None when the listing itself failed), followed by a final None. Once ``cancelled`` is
+    set (under ``_JOB_LOCK``) nobody reads ``results`` any more, so models that finish
+    afterwards are released here instead of queued.
+    """
+
+    def deliver(job, model, error):
+        with _JOB_LOCK:
+            if not cancelled.is_set():
+                results.put((job, model, error))
+                return
+        _release_model(model)
+
+    futures = {}
+    try:
+        data = _http_json(settings, "/api/dcc/blender/jobs?status=queued", method="GET")
+        jobs = data.get("jobs", []) if isinstance(data, dict) else []
+        for job in jobs if isinstance(jobs, list) else []:
+            if not isinstance(job, dict):
+                continue
+            job_id = str(job.get("jobId", "")).strip()
+            asset_id = str(job.get("assetId", "")).strip()
+            download_url = str(job.get("downloadUrl", "")).strip()
+            if not job_id or not download_url:
+                continue
+            future = executor.submit(
+                _pick_and_download, settings, job_id, asset_id, download_url, _infer_suffix(job)
+            )
+            futures[future] = job
+    except Exception as exc:
+        # submit() also raises here once a cancel has shut the executor down.
+        deliver(None, None, exc)
+    try:
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                model = future.result()
+            except Exception as exc:
+                deliver(futures[future], None, exc)
+            else:
+                deliver(futures[future], model, None)
+    finally:
+        results.put(None)
+
+
+def _take_queued(results):
+    """Block for the next ``_fetch_all_queued`` item, then take any others already queued."""
+    items = [results.get()]
+    while items[-1] is not None:
+        try:
+            items.append(results.get_nowait())
+        except queue.Empty:
+            break
+    return items
+
 
+def _release_queued(items):
+    for item in items:
+        if item is not None:
+            _release_model(item[1])
 
-def _pair_code(context, code):
+
+def _pair_code(settings, code):
     normalized_code = str(code or "").strip().upper()
     if not normalized_code:
         raise RuntimeError("Set Pair code in addon settings.")
     payload = _http_json(
-        context,
+        settings,
         path="/api/dcc/blender/pair",
         method="PUT",
         body={"code": normalized_code},
@@ -158,29 +770,46 @@ def _pair_code(context, code):
     return token
 
 
+def _build_importers():
+    # Newer Blender versions register the C++ OBJ/STL importers under wm; fall back to the legacy ones.
+    obj_import = bpy.ops.wm.obj_import if hasattr(bpy.ops.wm, "obj_import") else bpy.ops.import_scene.obj
+    stl_import = bpy.ops.wm.stl_import if hasattr(bpy.ops.wm, "stl_import") else bpy.ops.import_mesh.stl
+    return {
+        ".glb": bpy.ops.import_scene.gltf,
+        ".gltf": bpy.ops.import_scene.gltf,
+        ".obj": obj_import,
+        ".stl": stl_import,
+    }
+
+
 def _import_model_file(path):
     ext = os.path.splitext(path)[1].lower()
-    before_names = {obj.name for obj in bpy.data.objects}
-
-    if ext in {".glb", ".gltf"}:
-        bpy.ops.import_scene.gltf(filepath=path)
-    elif ext == ".obj":
-        if hasattr(bpy.ops.wm, "obj_import"):
-            bpy.ops.wm.obj_import(filepath=path)
-        else:
-            bpy.ops.import_scene.obj(filepath=path)
-    elif ext == ".stl":
-        if hasattr(bpy.ops.wm, "stl_import"):
-            bpy.ops.wm.stl_import(filepath=path)
-        else:
-            bpy.ops.import_mesh.stl(filepath=path)
-    else:
+    importer = _IMPORTERS.get(ext)
+    if importer is None:
         raise RuntimeError(f"Unsupported file extension: {ext}")
 
+    # keys() builds the name list in C instead of wrapping every object in Python first.
+    # bpy.data.objects is ordered by name, so slicing off the tail would not find new objects.
+    before_names = set(bpy.data.objects.keys())
+
+    importer(filepath=path)
+
     imported = [obj for obj in bpy.data.objects if obj.name not in before_names]
     return imported
 
 
+def _import_fetched_model(model):
+    """Import a ``(path, cached)`` model; a cached file the importer rejects is evicted."""
+    path, cached = model
+    try:
+        return _import_model_file(path)
+    except Exception:
+        # Otherwise every later import of this asset would hit the same broken file.
+        if cached:
+            _remove_file(path)
+        raise
+
+
 def _move_to_collection(scene, objects, collection_name):
     if not collection_name or not objects:
         return
@@ -191,9 +820,11 @@ def _move_to_collection(scene, objects, collection_name):
         scene.collection.children.link(collection)
 
     for obj in objects:
-        already_linked = any(coll.name == collection.name for coll in obj.users_collection)
-        if not already_linked:
+        try:
             collection.objects.link(obj)
+        except RuntimeError:
+            # Blender refuses to link an object twice; freshly imported objects rarely are.
+            pass
 
 
 class STORE3D_BRIDGE_Preferences(AddonPreferences):
@@ -203,6 +834,7 @@ class STORE3D_BRIDGE_Preferences(AddonPreferences):
         name="Server URL",
         description="Base URL of your site",
         default="http://localhost:3000",
+        update=_on_connection_settings_update,
     )
     api_token: StringProperty(
         name="API Token",
@@ -226,10 +858,18 @@ class STORE3D_BRIDGE_Preferences(AddonPreferences):
         description="Imported objects will also be linked to this collection",
         default="Store3D Imports",
     )
+    cache_size_mb: IntProperty(
+        name="Download cache (MB)",
+        description="Keep downloaded models on disk so re-imports skip the download (0 disables)",
+        default=512,
+        min=0,
+        max=100000,
+    )
     allow_insecure_tls: BoolProperty(
         name="Allow insecure TLS",
         description="Disable certificate verification (for local/self-signed HTTPS only)",
         default=False,
+        update=_on_connection_settings_update,
     )
 
     def draw(self, _context):
@@ -240,9 +880,143 @@ class STORE3D_BRIDGE_Preferences(AddonPreferences):
         layout.prop(self, "pair_code")
         layout.prop(self, "timeout_seconds")
         layout.prop(self, "import_collection")
+        layout.prop(self, "cache_size_mb")
         layout.prop(self, "allow_insecure_tls")
 
 
+def _tag_redraw_view3d():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+
+
+def _run_job(state, job):
+    """Run ``job`` and store its outcome in ``state``.
+
+    If ``_abandon_job`` gave up on the state first, nobody will collect the result, so it
+    is handed to ``state["release"]`` here instead.
+    """
+    result, error = None, None
+    try:
+        result = job()
+    except Exception as exc:
+        error = exc
+    finally:
+        with _JOB_LOCK:
+            state["result"], state["error"] = result, error
+            state["done"] = True
+            abandoned = state.get("abandoned", False)
+        release = state.get("release")
+        if abandoned and release is not None:
+            release(result)
+
+
+def _abandon_job(state):
+    """Give up on a ``_run_job`` state; its result is released exactly once either way."""
+    with _JOB_LOCK:
+        state["abandoned"] = True
+        done = state["done"]
+    release = state.get("release")
+    if done and release is not None:
+        release(state["result"])
+
+
+def _releasing_job(release, func, *args):
+    """Wrap ``func(*args)`` as a job whose result goes to ``release`` if its operator is cancelled."""
+    job = functools.partial(func, *args)
+    job.release = release
+    return job
+
+
+class _BackgroundOperator:
+    """Mixin for operators whose network I/O must not block Blender's UI.
+
+    Subclasses implement ``_steps(context)`` as a generator. Each value it yields is a
+    zero-argument callable that performs blocking I/O; the callable's return value (or
+    exception) is sent back into the generator. Code between yields runs on the main
+    thread, so it is the only place allowed to touch ``bpy``; the callables themselves
+    run on a worker thread when the operator is invoked from the UI and must only use
+    the ``_Settings`` snapshot. The generator's return value is the operator result.
+    ``execute()`` drives the same steps inline for scripted calls. Subclasses set
+    ``_task``; ``poll()`` refuses to start while any operator with the same task runs.
+    Jobs that return a model should be built with ``_releasing_job`` so a cancel
+    mid-download does not leak it.
+    """
+
+    _timer = None
+    _job_state = None
+
+    @classmethod
+    def poll(cls, _context):
+        return cls._task not in _ACTIVE_OPERATORS
+
+    def execute(self, context):
+        steps = self._steps(context)
+        value, error = None, None
+        while True:
+            try:
+                job = steps.throw(error) if error is not None else steps.send(value)
+            except StopIteration as stop:
+                return stop.value
+            value, error = None, None
+            try:
+                value = job()
+            except Exception as exc:
+                error = exc
+
+    def invoke(self, context, _event):
+        self._steps_iter = self._steps(context)
+        status = self._advance(None, None)
+        if status is not None:
+            return status
+
+        _ACTIVE_OPERATORS.add(self._task)
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type != "TIMER" or not self._job_state["done"]:
+            return {"PASS_THROUGH"}
+
+        status = self._advance(self._job_state["result"], self._job_state["error"])
+        if status is None:
+            return {"RUNNING_MODAL"}
+
+        context.window_manager.event_timer_remove(self._timer)
+        self._timer = None
+        _ACTIVE_OPERATORS.discard(self._task)
+        _tag_redraw_view3d()
+        return status
+
+    def cancel(self, context):
+        # Blender calls this instead of modal() when it drops the handler (file load, window close).
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        _ACTIVE_OPERATORS.discard(self._task)
+        if self._job_state is not None:
+            # The worker may still be running; its result is released once it arrives.
+            _abandon_job(self._job_state)
+        self._steps_iter.close()
+
+    def _advance(self, value, error):
+        """Resume the steps and start the next job off-thread; return the final status when done."""
+        try:
+            job = self._steps_iter.throw(error) if error is not None else self._steps_iter.send(value)
+        except StopIteration as stop:
+            return stop.value
+        except Exception as exc:
+            self.report({"ERROR"}, str(exc))
+            return {"CANCELLED"}
+
+        self._job_state = {"done": False, "result": None, "error": None, "release": getattr(job, "release", None)}
+        threading.Thread(target=_run_job, args=(self._job_state, job), daemon=True).start()
+        return None
+
+
 class STORE3D_BRIDGE_OT_TestConnection(Operator):
     bl_idname = "store3d_bridge.test_connection"
     bl_label = "Test connection"
@@ -250,7 +1024,9 @@ class STORE3D_BRIDGE_OT_TestConnection(Operator):
 
     def execute(self, context):
         try:
-            data = _http_json(context, "/api/dcc/blender/jobs?status=queued", method="GET")
+            settings = _snapshot_settings(context)
+            # Bypass the GET cache: this must prove the server is reachable right now.
+            data = _http_json(settings, "/api/dcc/blender/jobs?status=queued", method="GET", use_cache=False)
             jobs = data.get("jobs", []) if isinstance(data, dict) else []
             self.report({"INFO"}, f"Connection OK. Queued jobs: {len(jobs)}")
             return {"FINISHED"}
@@ -259,20 +1035,25 @@ class STORE3D_BRIDGE_OT_TestConnection(Operator):
             return {"CANCELLED"}
 
 
-class STORE3D_BRIDGE_OT_FetchJobs(Operator):
+class STORE3D_BRIDGE_OT_FetchJobs(_BackgroundOperator, Operator):
     bl_idname = "store3d_bridge.fetch_jobs"
     bl_label = "Fetch jobs"
     bl_description = "Fetch queued jobs from server"
+    _task = "fetch_jobs"
 
-    def execute(self, context):
-        wm = context.window_manager
+    def _steps(self, context):
         try:
-            data = _http_json(context, "/api/dcc/blender/jobs?status=queued", method="GET")
+            settings = _snapshot_settings(context)
+            data = yield lambda: _http_json(settings, "/api/dcc/blender/jobs?status=queued", method="GET")
             jobs = data.get("jobs", []) if isinstance(data, dict) else []
             if not isinstance(jobs, list):
                 jobs = []
-            wm.store3d_bridge_jobs = json.dumps(jobs, ensure_ascii=True)
+            wm = bpy.context.window_manager
+            wm.store3d_bridge_jobs = json.dumps(jobs, ensure_ascii=False, separators=(",", ":"))
             wm.store3d_bridge_last_count = len(jobs)
+            first = jobs[0] if jobs and isinstance(jobs[0], dict) else {}
+            wm.store3d_bridge_next_job_id = str(first.get("jobId", "")).strip()
+            wm.store3d_bridge_next_asset_id = str(first.get("assetId", "")).strip()
             self.report({"INFO"}, f"Fetched {len(jobs)} queued jobs.")
             return {"FINISHED"}
         except Exception as exc:
@@ -291,7 +1072,7 @@ class STORE3D_BRIDGE_OT_PairCode(Operator):
             self.report({"ERROR"}, "Addon preferences are not available.")
             return {"CANCELLED"}
         try:
-            token = _pair_code(context, prefs.pair_code)
+            token = _pair_code(_snapshot_settings(context), prefs.pair_code)
             prefs.api_token = token
             prefs.pair_code = ""
             self.report({"INFO"}, "Pairing successful. API token saved.")
@@ -301,20 +1082,22 @@ class STORE3D_BRIDGE_OT_PairCode(Operator):
             return {"CANCELLED"}
 
 
-class STORE3D_BRIDGE_OT_ImportLatest(Operator):
+class STORE3D_BRIDGE_OT_ImportLatest(_BackgroundOperator, Operator):
     bl_idname = "store3d_bridge.import_latest"
     bl_label = "Import latest"
     bl_description = "Fetch and import latest queued job"
+    _task = _IMPORT_TASK
 
-    def execute(self, context):
-        prefs = _get_prefs(context)
-        if not prefs:
+    def _steps(self, context):
+        if not _get_prefs(context):
             self.report({"ERROR"}, "Addon preferences are not available.")
             return {"CANCELLED"}
+        settings = _snapshot_settings(context)
 
-        temp_path = ""
+        job_id = ""
+        model = None
         try:
-            data = _http_json(context, "/api/dcc/blender/jobs?status=queued", method="GET")
+            data = yield lambda: _http_json(settings, "/api/dcc/blender/jobs?status=queued", method="GET")
             jobs = data.get("jobs", []) if isinstance(data, dict) else []
             if not isinstance(jobs, list) or not jobs:
                 self.report({"INFO"}, "No queued jobs.")
@@ -322,20 +1105,23 @@ class STORE3D_BRIDGE_OT_ImportLatest(Operator):
 
             job = jobs[0]
             job_id = str(job.get("jobId", "")).strip()
+            asset_id = str(job.get("assetId", "")).strip()
             download_url = str(job.get("downloadUrl", "")).strip()
             if not job_id or not download_url:
                 raise RuntimeError("Invalid job payload: jobId/downloadUrl is missing.")
-
-            _ack_job(context, job_id, "picked", "Picked by Blender addon.")
-
             suffix = _infer_suffix(job)
-            temp_path = _download_file(context, download_url, suffix=suffix)
-            imported_objects = _import_model_file(temp_path)
 
-            collection_name = (prefs.import_collection or "").strip()
-            _move_to_collection(context.scene, imported_objects, collection_name)
+            model = yield _releasing_job(
+                _release_model, _pick_and_download, settings, job_id, asset_id, download_url, suffix
+            )
+            imported_objects = _import_fetched_model(model)
 
-            _ack_job(context, job_id, "imported", "Imported to Blender.")
+            collection_name = (settings.import_collection or "").strip()
+            _move_to_collection(bpy.context.scene, imported_objects, collection_name)
+
+            yield lambda: _ack_job(settings, job_id, "imported", "Imported to Blender.")
+            if len(jobs) > 1 and isinstance(jobs[1], dict):
+                _prefetch_job(settings, jobs[1])
             self.report(
                 {"INFO"},
                 f"Imported job {job_id[:10]}... Objects: {len(imported_objects)}",
@@ -343,26 +1129,124 @@ class STORE3D_BRIDGE_OT_ImportLatest(Operator):
             return {"FINISHED"}
         except Exception as exc:
             message = str(exc)
-            try:
-                data = _http_json(context, "/api/dcc/blender/jobs?status=queued", method="GET")
-                jobs = data.get("jobs", []) if isinstance(data, dict) else []
-                if isinstance(jobs, list) and jobs:
-                    job_id = str(jobs[0].get("jobId", "")).strip()
-                    if job_id:
-                        try:
-                            _ack_job(context, job_id, "error", message[:220])
-                        except Exception:
-                            pass
-            except Exception:
-                pass
+            if job_id:
+
+                def ack_error():
+                    try:
+                        _ack_job(settings, job_id, "error", message[:220])
+                    except Exception:
+                        pass
+
+                yield ack_error
             self.report({"ERROR"}, message)
             return {"CANCELLED"}
         finally:
-            if temp_path and os.path.isfile(temp_path):
-                try:
-                    os.remove(temp_path)
-                except Exception:
-                    pass
+            _release_model(model)
+
+
+class STORE3D_BRIDGE_OT_ImportAll(_BackgroundOperator, Operator):
+    bl_idname = "store3d_bridge.import_all"
+    bl_label = "Import all"
+    bl_description = "Download all queued jobs in parallel and import them one by one"
+    _task = _IMPORT_TASK
+
+    def _steps(self, context):
+        try:
+            self._start(context)
+        except Exception as exc:
+            self.report({"ERROR"}, str(exc))
+            return {"CANCELLED"}
+        try:
+            # Downloads overlap on the pool; imports run here on the main thread, one at a time.
+            while not self._listing_done:
+                items = yield _releasing_job(_release_queued, _take_queued, self._results)
+                for item in items:
+                    self._import_item(item)
+            yield lambda: concurrent.futures.wait(self._acks + self._error_acks)
+        finally:
+            self._stop_fetching()
+        return self._finish()
+
+    def _start(self, context):
+        self._settings = _snapshot_settings(context)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=_IMPORT_ALL_WORKERS)
+        self._results = queue.Queue()
+        self._cancelled = threading.Event()
+        self._listing_done = False
+        self._acks = []
+        self._error_acks = []
+        self._errors = []
+        self._imported = 0
+        self._objects = 0
+        threading.Thread(
+            target=_fetch_all_queued,
+            args=(self._settings, self._executor, self._results, self._cancelled),
+            daemon=True,
+        ).start()
+
+    def _stop_fetching(self):
+        # Downloads still running release their own models once the flag is set; anything
+        # queued before that is released here.
+        with _JOB_LOCK:
+            self._cancelled.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        while True:
+            try:
+                item = self._results.get_nowait()
+            except queue.Empty:
+                break
+            _release_queued([item])
+
+    def _import_item(self, item):
+        if item is None:
+            self._listing_done = True
+            return
+        job, model, error = item
+        if job is None:
+            self._errors.append(str(error))
+            return
+
+        job_id = str(job.get("jobId", "")).strip()
+        try:
+            if error is not None:
+                raise error
+            imported_objects = _import_fetched_model(model)
+            collection_name = (self._settings.import_collection or "").strip()
+            _move_to_collection(bpy.context.scene, imported_objects, collection_name)
+        except Exception as exc:
+            message = str(exc)
+            self._errors.append(message)
+            self._error_acks.append(
+                self._executor.submit(_ack_job, self._settings, job_id, "error", message[:220])
+            )
+            return
+        finally:
+            _release_model(model)
+
+        self._imported += 1
+        self._objects += len(imported_objects)
+        self._acks.append(
+            self._executor.submit(_ack_job, self._settings, job_id, "imported", "Imported to Blender.")
+        )
+
+    def _finish(self):
+        # Failed 'error' acks are best effort, as in Import latest; failed 'imported' acks are reported.
+        for future in self._acks:
+            if future.exception() is not None:
+                self._errors.append(str(future.exception()))
+        if not self._imported:
+            if self._errors:
+                self.report({"ERROR"}, self._errors[0])
+            else:
+                self.report({"INFO"}, "No queued jobs.")
+            return {"CANCELLED"}
+
+        summary = f"Imported {self._imported} jobs. Objects: {self._objects}"
+        if self._errors:
+            self.report({"ERROR"}, f"{summary}. Failed: {len(self._errors)} ({self._errors[0]})")
+        else:
+            self.report({"INFO"}, summary)
+        return {"FINISHED"}
 
 
 class STORE3D_BRIDGE_PT_Panel(Panel):
@@ -390,21 +1274,16 @@ class STORE3D_BRIDGE_PT_Panel(Panel):
         row.operator("store3d_bridge.test_connection", icon="CHECKMARK")
         row.operator("store3d_bridge.fetch_jobs", icon="FILE_REFRESH")
 
-        layout.operator("store3d_bridge.import_latest", icon="IMPORT")
+        row = layout.row(align=True)
+        row.operator("store3d_bridge.import_latest", icon="IMPORT")
+        row.operator("store3d_bridge.import_all", icon="DOCUMENTS")
         layout.separator()
 
+        # draw() runs on every redraw, so it only reads the scalars written by Fetch jobs.
         layout.label(text=f"Queued (cached): {int(wm.store3d_bridge_last_count)}")
-        jobs = []
-        try:
-            jobs = json.loads(wm.store3d_bridge_jobs) if wm.store3d_bridge_jobs else []
-        except Exception:
-            jobs = []
-        if isinstance(jobs, list) and jobs:
-            first = jobs[0]
-            job_id = str(first.get("jobId", "")).strip()
-            asset_id = str(first.get("assetId", "")).strip()
-            layout.label(text=f"Next job: {job_id[:16]}")
-            layout.label(text=f"Asset: {asset_id[:16]}")
+        if wm.store3d_bridge_last_count > 0:
+            layout.label(text=f"Next job: {wm.store3d_bridge_next_job_id[:16]}")
+            layout.label(text=f"Asset: {wm.store3d_bridge_next_asset_id[:16]}")
         else:
             layout.label(text="No cached jobs.")
 
@@ -415,31 +1294,59 @@ CLASSES = (
     STORE3D_BRIDGE_OT_FetchJobs,
     STORE3D_BRIDGE_OT_PairCode,
     STORE3D_BRIDGE_OT_ImportLatest,
+    STORE3D_BRIDGE_OT_ImportAll,
     STORE3D_BRIDGE_PT_Panel,
 )
 
 
-def register():
-    for cls in CLASSES:
-        bpy.utils.register_class(cls)
-    bpy.types.WindowManager.store3d_bridge_jobs = StringProperty(
+# Defined once at import time; register() attaches them and unregister() removes them again.
+WM_PROPERTIES = {
+    "store3d_bridge_jobs": StringProperty(
         name="Store3D Bridge Jobs JSON",
         default="[]",
         options={"HIDDEN"},
-    )
-    bpy.types.WindowManager.store3d_bridge_last_count = IntProperty(
+    ),
+    "store3d_bridge_last_count": IntProperty(
         name="Store3D Bridge Last Count",
         default=0,
         min=0,
         options={"HIDDEN"},
-    )
+    ),
+    "store3d_bridge_next_job_id": StringProperty(
+        name="Store3D Bridge Next Job ID",
+        default="",
+        options={"HIDDEN"},
+    ),
+    "store3d_bridge_next_asset_id": StringProperty(
+        name="Store3D Bridge Next Asset ID",
+        default="",
+        options={"HIDDEN"},
+    ),
+}
+
+
+def register():
+    for cls in CLASSES:
+        bpy.utils.register_class(cls)
+    _IMPORTERS.update(_build_importers())
+    for name, prop in WM_PROPERTIES.items():
+        setattr(bpy.types.WindowManager, name, prop)
 
 
 def unregister():
-    if hasattr(bpy.types.WindowManager, "store3d_bridge_last_count"):
-        del bpy.types.WindowManager.store3d_bridge_last_count
-    if hasattr(bpy.types.WindowManager, "store3d_bridge_jobs"):
-        del bpy.types.WindowManager.store3d_bridge_jobs
+    _ACTIVE_OPERATORS.clear()
+    _discard_prefetched()
+    _BASE_URL_CACHE.clear()
+    _PROXY_CACHE.clear()
+    _close_connections()
+    _invalidate_http_cache()
+    _reset_ssl_contexts()
+    _IMPORTERS.clear()
+    for name in WM_PROPERTIES:
+        try:
+            delattr(bpy.types.WindowManager, name)
+        except AttributeError:
+            pass
     for cls in reversed(CLASSES):
         bpy.utils.unregister_class(cls)
 